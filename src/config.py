@@ -19,6 +19,9 @@ class Config:
     # Directory path for storing plugin instance images
     plugin_image_dir = os.path.join(BASE_DIR, "static", "images", "plugins")
 
+    # Directory path for plugin-managed caches (e.g. downloaded photos)
+    cache_dir = os.path.join(BASE_DIR, "static", "images", "cache")
+
     def __init__(self):
         self.config = self.read_config()
         self.plugins_list = self.read_plugins_list()
@@ -57,8 +60,10 @@ class Config:
         logger.debug(f"Writing device config to {self.config_file}")
         self.update_value("playlist_config", self.playlist_manager.to_dict())
         self.update_value("refresh_info", self.refresh_info.to_dict())
+        # Serialize up front: one write call, and a serialization error can no longer truncate the file
+        serialized = json.dumps(self.config, indent=4)
         with open(self.config_file, 'w') as outfile:
-            json.dump(self.config, outfile, indent=4)
+            outfile.write(serialized)
 
     def get_config(self, key=None, default={}):
         """Gets the value of a specific configuration key or returns the entire config if none provided."""
@@ -1,4 +1,5 @@
 import fnmatch
+import functools
 import logging
 
 from utils.image_utils import resize_image, change_orientation, apply_image_enhancement
@@ -7,6 +8,9 @@ from PIL import ImageColor
 
 logger = logging.getLogger(__name__)
 
+# Only a handful of distinct background colors are ever used, so memoize parsing them
+_parse_color = functools.lru_cache(maxsize=32)(ImageColor.getrgb)
+
 # Try to import hardware displays, but don't fail if they're not available
 try:
     from display.inky_display import InkyDisplay
@@ -75,14 +79,16 @@ class DisplayManager:
 
         bg_hex = backgroundColor or "#FFFFFF"
         try:
-            background = ImageColor.getrgb(bg_hex)
+            background = _parse_color(bg_hex)
         except ValueError:
             logger.warning(f"Invalid backgroundColor '{bg_hex}', defaulting to white")
             background = (255, 255, 255)
 
         orientation = self.device_config.get_config("orientation", default="horizontal")
-        logger.debug("display_image applying orientation=%s", orientation)
-        image = change_orientation(image, orientation)
+        inverted = bool(self.device_config.get_config("inverted_image"))
+        logger.debug("display_image applying orientation=%s inverted=%s", orientation, inverted)
+        # Fold the inversion into the orientation turn so the frame is rotated once, before the resize
+        image = change_orientation(image, orientation, inverted=inverted)
         logger.debug("display_image post-orientation size=%s", image.size)
 
         fit_config = {}
@@ -104,10 +110,6 @@ class DisplayManager:
         )
         logger.debug("display_image post-resize size=%s", image.size)
 
-        if self.device_config.get_config("inverted_image"):
-            image = image.rotate(180)
-            logger.debug("display_image applied inversion rotation")
-
         image = apply_image_enhancement(
             image,
             self.device_config.get_config("image_settings", {}),
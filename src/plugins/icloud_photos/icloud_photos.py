@@ -1,18 +1,42 @@
+import os
 import re
 import json
+import functools
+import math
 import random
 import io
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageOps, UnidentifiedImageError
 from plugins.base_plugin.base_plugin import BasePlugin
 
+# libvips is optional; when present it decodes and shrinks photos in one streaming pass
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+
+# libvips pads truncated images with grey by default; fail instead, as Pillow does
+# (fail_on= replaced the stricter fail= in libvips 8.12)
+if pyvips is not None:
+    VIPS_FAIL_ON_TRUNCATED = "fail_on=truncated" if pyvips.at_least_libvips(8, 12) else "fail=true"
+
 USER_AGENT = "InkyPi/iCloudPhotos/0.1"
 DEFAULT_HEADERS = {"Content-Type": "text/plain", "User-Agent": USER_AGENT}
 TIMEOUT = 30
+EXIF_ORIENTATION_TAG = 0x0112
+MAX_CACHED_PHOTOS = 50
 
 SESSION = requests.Session()
 SESSION.headers.update(DEFAULT_HEADERS)
+# Pool keep-alive connections so the API calls and the photo download share TLS sessions
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+))
 
 logger = logging.getLogger(__name__)
 
@@ -20,19 +44,23 @@ logger = logging.getLogger(__name__)
 # Module-level helper functions
 # ---------------------------
 
+BASE62_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+
+# ord(char) -> digit value, -1 for characters outside the base62 alphabet
+_BASE62_LUT = [BASE62_CHARS.find(chr(code)) for code in range(128)]
+
 def base62_decode(s):
     """
     Decode a base62-encoded string into an integer.
     Characters: 0-9, A-Z, a-z
     """
-    chars = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
-    char_map = {c: i for i, c in enumerate(chars)}
-    
     value = 0
     for char in s:
-        if char not in char_map:
+        code = ord(char)
+        digit = _BASE62_LUT[code] if code < 128 else -1
+        if digit < 0:
             raise ValueError(f"Invalid base62 character: {char}")
-        value = value * 62 + char_map[char]
+        value = value * 62 + digit
     return value
 
 def get_stream_id(url):
@@ -53,6 +81,7 @@ def get_stream_id(url):
     return stream_id
 
 
+@functools.lru_cache(maxsize=32)
 def get_partition(stream_id):
     """Compute the iCloud partition from the stream ID using base62."""
     enc = stream_id[1] if stream_id.startswith("A") else stream_id[1:3]
@@ -174,7 +203,17 @@ class IcloudPhotos(BasePlugin):
         checksum = saved[guid]["checksum"]
         logger.info("Selected guid=%s (unseen remaining: %d, total online: %d)", guid, len(unseen), len(latest_map))
 
-        photo_url = get_photo_url(stream_id, guid, checksum)
+        dimensions = device_config.get_resolution()
+        if device_config.get_config("orientation") == "vertical":
+            dimensions = dimensions[::-1]
+
+        cache_path = os.path.join(
+            device_config.cache_dir, "icloud_photos", f"{checksum}_{dimensions[0]}x{dimensions[1]}.png"
+        )
+        image = self._load_cached_image(cache_path)
+        if image is None:
+            photo_url = get_photo_url(stream_id, guid, checksum)
+
         if not saved[guid].get("viewed"):
             saved[guid]["viewed"] = True
             dirty = True
@@ -184,25 +223,113 @@ class IcloudPhotos(BasePlugin):
             settings["photos"] = saved
             logger.debug("Persisted state with %d photos", len(saved))
 
-        # 6) Render
-        image = self._download_image(photo_url)
+        # 6) Render (downloads are cached by checksum, skipping network and decode on repeats)
         if image is None:
-            raise RuntimeError("Failed to download image from iCloud.")
+            image = self._download_image(photo_url, dimensions)
+            if image is None:
+                raise RuntimeError("Failed to download image from iCloud.")
+            # Photos only repeat after the whole album has been shown, so caching an
+            # album larger than the cache would evict every entry before its next
+            # use and only wear the SD card
+            if len(saved) <= MAX_CACHED_PHOTOS:
+                self._store_cached_image(cache_path, image)
+
+        return image
+
+    def _fit_with_vips(self, data, dimensions):
+        """
+        libvips counterpart of the Pillow path in _download_image: decode with
+        shrink-on-load, apply EXIF rotation and shrink to the cover size of
+        dimensions in one sequential pass, then hand back an RGB PIL image.
+        """
+        # Sequential access only decodes the header up front; corrupt, truncated or
+        # undecodable bodies fail later, in thumbnail_buffer() or write_to_memory()
+        try:
+            header = pyvips.Image.new_from_buffer(data, "", access="sequential")
+
+            width, height = header.width, header.height
+            if header.get_typeof("orientation") and header.get("orientation") in (5, 6, 7, 8):
+                width, height = height, width
+
+            scale = min(1, max(dimensions[0] / width, dimensions[1] / height))
+            image = pyvips.Image.thumbnail_buffer(
+                data, math.ceil(width * scale), height=math.ceil(height * scale), size="down",
+                option_string=VIPS_FAIL_ON_TRUNCATED
+            )
+
+            if image.interpretation != "srgb":
+                image = image.colourspace("srgb")
+            if image.hasalpha():
+                image = image.flatten()
+            if image.format != "uchar":
+                image = image.cast("uchar")
+
+            pixels = image.write_to_memory()
+        except pyvips.Error as e:
+            raise RuntimeError("Downloaded content is not a valid image format.") from e
+
+        return Image.frombytes("RGB", (image.width, image.height), pixels)
 
+    def _load_cached_image(self, cache_path):
+        """Return the cached image at cache_path, or None on a cache miss."""
+        if not os.path.isfile(cache_path):
+            return None
+        try:
+            with Image.open(cache_path) as im:
+                image = im.convert("RGB")
+        except OSError:
+            logger.warning("Ignoring unreadable cached photo %s", cache_path)
+            return None
+        os.utime(cache_path)  # mark as recently used for LRU eviction
+        logger.debug("Loaded cached photo %s", cache_path)
         return image
 
-    def _download_image(self, url):
-        """Download image bytes and return an RGB PIL image."""
+    def _store_cached_image(self, cache_path, image):
+        """Save image to cache_path, evicting the least recently used photos over MAX_CACHED_PHOTOS."""
+        cache_dir = os.path.dirname(cache_path)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            image.save(cache_path, optimize=True)
+
+            cached = [os.path.join(cache_dir, f) for f in os.listdir(cache_dir)]
+            cached.sort(key=os.path.getmtime, reverse=True)
+            for stale in cached[MAX_CACHED_PHOTOS:]:
+                os.remove(stale)
+        except OSError as e:
+            logger.warning("Failed to update photo cache: %s", e)
+
+    def _download_image(self, url, dimensions):
+        """
+        Download image bytes and return an RGB PIL image. JPEGs are decoded at
+        the smallest DCT scale that still covers dimensions.
+        """
         logger.debug("Downloading image: %s", url)
         try:
             resp = SESSION.get(url, timeout=TIMEOUT)
             resp.raise_for_status()
         except requests.RequestException as e:
             raise RuntimeError(f"Failed to download image: {e}") from e
-        
+
+        if pyvips is not None:
+            return self._fit_with_vips(resp.content, dimensions)
+
         try:
             with Image.open(io.BytesIO(resp.content)) as im:
+                # draft() runs before exif_transpose, so target the stored (unrotated) axes
+                rotated = im.getexif().get(EXIF_ORIENTATION_TAG) in (5, 6, 7, 8)
+                im.draft("RGB", dimensions[::-1] if rotated else dimensions)
                 im = ImageOps.exif_transpose(im)
-                return im.convert("RGB")
         except UnidentifiedImageError as e:
             raise RuntimeError("Downloaded content is not a valid image format.") from e
+
+        # JPEGs usually decode straight to RGB; only convert other modes
+        if im.mode != "RGB":
+            im = im.convert("RGB")
+
+        # Shrink in place to the smallest size that still covers dimensions, leaving
+        # only a small final resize for DisplayManager's fit strategies
+        scale = max(dimensions[0] / im.width, dimensions[1] / im.height)
+        if scale < 1:
+            cover_size = (math.ceil(im.width * scale), math.ceil(im.height * scale))
+            im.thumbnail(cover_size, Image.LANCZOS, reducing_gap=2.0)
+        return im
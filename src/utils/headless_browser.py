@@ -0,0 +1,234 @@
+import atexit
+import base64
+import json
+import logging
+import os
+import select
+import subprocess
+import threading
+import time
+from io import BytesIO
+from pathlib import Path
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+CHROMIUM_BINARY = "chromium-headless-shell"
+
+# Rendering backends, selected with the HEADLESS_CHROMIUM_GPU environment variable.
+# "software" (default) rasterizes with SwiftShader on the CPU, which is stable for
+# text-heavy pages; "hardware" composites through the Pi's GPU over EGL, which
+# helps canvas and chart-heavy plugins.
+CHROMIUM_GPU_FLAGS = {
+    "software": [
+        "--disable-gpu",
+        "--use-gl=swiftshader",
+        "--in-process-gpu"
+    ],
+    "hardware": [
+        "--use-gl=egl",
+        "--ignore-gpu-blocklist",
+        "--enable-accelerated-2d-canvas"
+    ]
+}
+CHROMIUM_GPU = os.getenv("HEADLESS_CHROMIUM_GPU", "software")
+if CHROMIUM_GPU not in CHROMIUM_GPU_FLAGS:
+    logger.warning(f"Unknown HEADLESS_CHROMIUM_GPU value '{CHROMIUM_GPU}', using software rendering")
+    CHROMIUM_GPU = "software"
+
+CHROMIUM_FLAGS = [
+    "--headless",
+    "--disable-dev-shm-usage",
+    *CHROMIUM_GPU_FLAGS[CHROMIUM_GPU],
+    "--hide-scrollbars",
+    "--js-flags=--jitless",
+    "--disable-zero-copy",
+    "--disable-gpu-memory-buffer-compositor-resources",
+    "--disable-extensions",
+    "--disable-plugins",
+    "--mute-audio",
+    "--no-sandbox"
+]
+
+# Seconds the browser may sit unused before it is shut down to free memory
+IDLE_TIMEOUT = 300
+# Page load budget when the caller does not pass timeout_ms
+DEFAULT_LOAD_TIMEOUT_MS = 30000
+# Budget for individual DevTools commands
+COMMAND_TIMEOUT = 30
+
+class HeadlessBrowser:
+    """
+    A long-lived chromium-headless-shell process driven over the Chrome
+    DevTools Protocol, so repeated screenshots skip the browser cold start.
+
+    --remote-debugging-pipe reads NUL-terminated JSON commands from fd 3 and
+    writes responses to fd 4; a small sh wrapper maps those onto the child's
+    stdin/stdout pipes.
+    """
+
+    def __init__(self):
+        self.process = None
+        self.lock = threading.Lock()
+        self.idle_timer = None
+        self._buffer = b""
+        self._events = []
+        self._next_id = 0
+        atexit.register(self.close)
+
+    @staticmethod
+    def is_supported():
+        """The pipe transport relies on POSIX pipes and select()."""
+        return os.name == "posix"
+
+    def screenshot(self, target, dimensions, timeout_ms=None):
+        """
+        Render target (a URL or local file path) at dimensions and return a PIL
+        image, or None if the persistent browser could not produce one.
+        """
+        with self.lock:
+            self._cancel_idle_timer()
+            try:
+                if not self._is_running():
+                    self._start()
+                return self._capture(target, dimensions, timeout_ms or DEFAULT_LOAD_TIMEOUT_MS)
+            except Exception as e:
+                logger.warning(f"Persistent browser screenshot failed, restarting browser: {str(e)}")
+                self._stop()
+                return None
+            finally:
+                self._schedule_idle_timer()
+
+    def close(self):
+        """Shut down the browser process, if running."""
+        with self.lock:
+            self._cancel_idle_timer()
+            self._stop()
+
+    def _is_running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def _start(self):
+        logger.info("Starting persistent headless browser")
+        command = [
+            "sh", "-c", 'exec "$0" "$@" 3<&0 4>&1 0</dev/null 1>&2',
+            CHROMIUM_BINARY,
+            "--remote-debugging-pipe",
+            *CHROMIUM_FLAGS
+        ]
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self._buffer = b""
+        self._events = []
+
+    def _stop(self):
+        if self.process is None:
+            return
+        logger.info("Stopping persistent headless browser")
+        try:
+            self.process.stdin.close()
+            self.process.terminate()
+            self.process.wait(timeout=5)
+        except Exception:
+            self.process.kill()
+        self.process = None
+
+    def _cancel_idle_timer(self):
+        if self.idle_timer:
+            self.idle_timer.cancel()
+            self.idle_timer = None
+
+    def _schedule_idle_timer(self):
+        if self._is_running():
+            self.idle_timer = threading.Timer(IDLE_TIMEOUT, self.close)
+            self.idle_timer.daemon = True
+            self.idle_timer.start()
+
+    def _capture(self, target, dimensions, timeout_ms):
+        url = Path(target).absolute().as_uri() if os.path.exists(target) else target
+        width, height = map(int, dimensions)
+
+        # A fresh page per capture; closing it afterwards lets its renderer process
+        # exit, so the page's DOM and V8 heap are not held while the browser idles
+        target_id = self._call("Target.createTarget", {"url": "about:blank"})["targetId"]
+        try:
+            session = self._call("Target.attachToTarget", {"targetId": target_id, "flatten": True})["sessionId"]
+            self._call("Page.enable", session_id=session)
+            self._call("Emulation.setDeviceMetricsOverride", {
+                "width": width,
+                "height": height,
+                "deviceScaleFactor": 1,
+                "mobile": False
+            }, session)
+
+            self._events = []
+            navigation = self._call("Page.navigate", {"url": url}, session)
+            if navigation.get("errorText"):
+                raise RuntimeError(f"Navigation to {url} failed: {navigation['errorText']}")
+
+            # Like the CLI's --timeout, capture whatever has rendered once the budget is spent
+            if not self._wait_for_event("Page.loadEventFired", session, time.monotonic() + timeout_ms / 1000):
+                logger.warning(f"Page load timed out after {timeout_ms} ms, capturing current state")
+                self._call("Page.stopLoading", session_id=session)
+
+            screenshot = self._call("Page.captureScreenshot", {"format": "png"}, session)
+        finally:
+            self._call("Target.closeTarget", {"targetId": target_id})
+
+        with Image.open(BytesIO(base64.b64decode(screenshot["data"]))) as img:
+            return img.convert("RGB")
+
+    def _call(self, method, params=None, session_id=None):
+        """Send a DevTools command and block until its response arrives."""
+        self._next_id += 1
+        message = {"id": self._next_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        self.process.stdin.write(json.dumps(message).encode("utf-8") + b"\0")
+        self.process.stdin.flush()
+
+        deadline = time.monotonic() + COMMAND_TIMEOUT
+        while True:
+            response = self._read_message(deadline)
+            if response is None:
+                raise TimeoutError(f"Timed out waiting for {method}")
+            if response.get("id") == message["id"]:
+                if "error" in response:
+                    raise RuntimeError(f"{method} failed: {response['error'].get('message')}")
+                return response.get("result", {})
+            if "method" in response:
+                self._events.append(response)
+
+    def _wait_for_event(self, method, session_id, deadline):
+        """Wait for an event on session_id, including ones buffered while awaiting responses."""
+        while True:
+            for event in self._events:
+                if event["method"] == method and event.get("sessionId") == session_id:
+                    return True
+            event = self._read_message(deadline)
+            if event is None:
+                return False
+            if "method" in event:
+                self._events.append(event)
+
+    def _read_message(self, deadline):
+        """Read the next NUL-terminated message, or return None once deadline passes."""
+        fd = self.process.stdout.fileno()
+        while b"\0" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise RuntimeError("Browser process exited")
+            self._buffer += chunk
+
+        raw, self._buffer = self._buffer.split(b"\0", 1)
+        return json.loads(raw)
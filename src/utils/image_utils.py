@@ -1,4 +1,7 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import PIL
 from PIL import Image, ImageEnhance, ImageOps
 from io import BytesIO
 import os
@@ -6,18 +9,140 @@ import logging
 import hashlib
 import tempfile
 import subprocess
+import threading
+from collections import OrderedDict
+from utils.headless_browser import HeadlessBrowser, CHROMIUM_BINARY, CHROMIUM_FLAGS
 
 logger = logging.getLogger(__name__)
 
-def get_image(image_url):
-    response = requests.get(image_url)
-    img = None
-    if 200 <= response.status_code < 300 or response.status_code == 304:
-        img = Image.open(BytesIO(response.content))
-    else:
-        logger.error(f"Received non-200 response from {image_url}: status_code: {response.status_code}")
+_BROWSER = HeadlessBrowser()
+
+# Shared session so repeated image fetches reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# (connect, read) timeouts in seconds for image downloads
+IMAGE_REQUEST_TIMEOUT = (3.05, 15)
+
+# Downloads larger than this are rejected rather than risk exhausting the Pi's memory
+MAX_IMAGE_BYTES = 20 * 1024 * 1024
+IMAGE_CHUNK_BYTES = 65536
+
+# Bodies of recently fetched images with their ETag/Last-Modified validators, so an
+# unchanged image costs a conditional GET instead of a full download; least recently
+# used first, bounded in both entries and bytes
+_URL_CACHE = OrderedDict()
+_URL_CACHE_LOCK = threading.Lock()
+URL_CACHE_SIZE = 8
+URL_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Pillow-SIMD publishes versions like "9.5.0.post1"; its ImageEnhance is already vectorized
+_PILLOW_SIMD = ".post" in PIL.__version__
+
+# Filter for resizing frames to the panel. Dithering down to the panel's few colors
+# hides any difference from LANCZOS, and the 4-tap kernel needs far fewer multiply-adds
+RESAMPLE = Image.BICUBIC
+
+# ITU-R 601-2 luma weights, as used by Image.convert("L") and ImageEnhance.Color
+LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+# Minimum bytes of raw pixel data fed per update() call in compute_image_hash
+HASH_CHUNK_BYTES = 65536
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+PNG_END = b"IEND\xaeB`\x82"
+
+# tmpfs-backed directory for render scratch files, sparing the SD card; None = system default
+TEMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+
+# Cold-start screenshots go through chromium's stdout where /dev/stdout exists;
+# cleared if chromium turns out not to write there
+_SCREENSHOT_TO_STDOUT = os.path.exists("/dev/stdout")
+
+def get_image(image_url, desired_size=None):
+    """
+    Download an image. When desired_size is given, JPEGs are decoded at the
+    smallest DCT scale that still covers twice that size (see Image.draft),
+    leaving the later resize enough source pixels to filter.
+
+    Responses carrying an ETag or Last-Modified header are kept in _URL_CACHE
+    and revalidated on the next fetch; a 304 reuses the cached bytes.
+    """
+    with _URL_CACHE_LOCK:
+        cached = _URL_CACHE.get(image_url)
+
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    with _SESSION.get(image_url, headers=headers, stream=True, timeout=IMAGE_REQUEST_TIMEOUT) as response:
+        if response.status_code == 304 and cached:
+            logger.debug(f"Image at {image_url} not modified, using cached copy")
+            with _URL_CACHE_LOCK:
+                if image_url in _URL_CACHE:
+                    _URL_CACHE.move_to_end(image_url)
+            data = BytesIO(cached[2])
+        elif 200 <= response.status_code < 300 or response.status_code == 304:
+            data = _read_capped(response, image_url)
+            if data is None:
+                return None
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                body = data.getvalue()
+                _cache_response(image_url, etag, last_modified, body)
+                data = BytesIO(body)
+        else:
+            logger.error(f"Received non-200 response from {image_url}: status_code: {response.status_code}")
+            return None
+
+    img = Image.open(data)
+    if desired_size and img.format == "JPEG":
+        desired_width, desired_height = map(int, desired_size)
+        img.draft("RGB", (desired_width * 2, desired_height * 2))
     return img
 
+def _cache_response(image_url, etag, last_modified, body):
+    """Remember a validated response body, evicting the least recently used entries."""
+    if len(body) > URL_CACHE_MAX_BYTES:
+        return
+    with _URL_CACHE_LOCK:
+        _URL_CACHE[image_url] = (etag, last_modified, body)
+        _URL_CACHE.move_to_end(image_url)
+        total = sum(len(entry[2]) for entry in _URL_CACHE.values())
+        while len(_URL_CACHE) > URL_CACHE_SIZE or total > URL_CACHE_MAX_BYTES:
+            _, (_, _, evicted) = _URL_CACHE.popitem(last=False)
+            total -= len(evicted)
+
+def _read_capped(response, image_url):
+    """
+    Read a streamed response body into a BytesIO, or return None if it is
+    larger than MAX_IMAGE_BYTES.
+    """
+    content_length = response.headers.get("Content-Length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_IMAGE_BYTES:
+        logger.error(f"Image at {image_url} is {content_length} bytes, over the {MAX_IMAGE_BYTES} byte limit")
+        return None
+
+    data = BytesIO()
+    for chunk in response.iter_content(chunk_size=IMAGE_CHUNK_BYTES):
+        data.write(chunk)
+        if data.tell() > MAX_IMAGE_BYTES:
+            logger.error(f"Image at {image_url} exceeds the {MAX_IMAGE_BYTES} byte limit")
+            return None
+    data.seek(0)
+    return data
+
 def change_orientation(image, orientation, inverted=False):
     if orientation == 'horizontal':
         angle = 0
@@ -27,181 +152,321 @@ def change_orientation(image, orientation, inverted=False):
     if inverted:
         angle = (angle + 180) % 360
 
+    # rotate() would return a full copy for a zero angle
+    if angle == 0:
+        return image
+
     return image.rotate(angle, expand=1)
 
+def _contain_on_canvas(image, size, background):
+    """
+    Scale image to fit within size (keeping aspect ratio) and center it on a
+    background-filled RGB canvas.
+    """
+    # pad() builds its canvas in the source mode; RGBA takes an RGB fill, so those
+    # sources are only converted after the downscale rather than at full size
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGB")
+    # pad() resizes once and skips the canvas when the result already fills size
+    result = ImageOps.pad(image, size, method=RESAMPLE, color=background, centering=(0.5, 0.5))
+    return result if result.mode == "RGB" else result.convert("RGB")
+
+def _reducible(mode):
+    """
+    Whether reduce() can box-filter mode. It rejects bilevel, palette and
+    16-bit grayscale (I;16*, which Pillow opens 16-bit PNGs as), and would
+    average palette indices for PA. resize() handles all of these directly.
+    """
+    return mode not in ("1", "P", "PA") and not mode.startswith("I;16")
+
+def _prereduce(image, size):
+    """
+    Box-filter image down by the largest integer factor that still leaves at
+    least twice size, so the resampling filters that follow convolve far fewer
+    source pixels while keeping enough of them to avoid aliasing.
+    """
+    factor = min(image.width // (size[0] * 2), image.height // (size[1] * 2))
+    if factor < 2 or not _reducible(image.mode):
+        return image
+    return image.reduce(factor)
+
 def resize_image(image, desired_size, fit=None, orientation="horizontal", background=(255, 255, 255)):
     """
     Resize/crop image to desired_size based on fit strategy.
     fit: { "strategy": "smart|cover|contain|stretch|default", "preserve": "none|width|height" }
     """
-    logger.debug(
-        "resize_image start | size=%s image_size=%s fit=%s orientation=%s background=%s",
-        desired_size,
-        image.size,
-        fit,
-        orientation,
-        background,
-    )
     desired_width, desired_height = map(int, desired_size)
+    size = (desired_width, desired_height)
     fit = fit or {}
     strategy = fit.get("strategy", "default")
     preserve = fit.get("preserve", "none")
 
+    source_size = image.size
+    image = _prereduce(image, size)
     img_w, img_h = image.size
     is_landscape_or_square = img_w >= img_h
     is_portrait = not is_landscape_or_square
 
     # Preserve semantics (replaces any legacy keep-width/height idea)
     if preserve == "width":
-        logger.debug("resize_image preserve width branch | desired=%s", desired_size)
+        branch = "preserve width"
         desired_ratio = desired_width / desired_height
         new_height = int(img_w / desired_ratio)
         y0 = max(0, (img_h - new_height) // 2)
-        result = image.crop((0, y0, img_w, min(img_h, y0 + new_height))) \
-                    .resize((desired_width, desired_height), Image.LANCZOS)
-        logger.debug("resize_image preserve width result_size=%s", result.size)
-        return result
+        # resize(box=...) crops and resamples in one pass, without a cropped intermediate
+        result = image.resize(size, RESAMPLE, box=(0, y0, img_w, min(img_h, y0 + new_height)))
 
-    if preserve == "height":
-        logger.debug("resize_image preserve height branch | desired=%s", desired_size)
+    elif preserve == "height":
+        branch = "preserve height"
         desired_ratio = desired_width / desired_height
         new_width = int(img_h * desired_ratio)
         x0 = max(0, (img_w - new_width) // 2)
-        result = image.crop((x0, 0, min(img_w, x0 + new_width), img_h)) \
-                    .resize((desired_width, desired_height), Image.LANCZOS)
-        logger.debug("resize_image preserve height result_size=%s", result.size)
-        return result
+        result = image.resize(size, RESAMPLE, box=(x0, 0, min(img_w, x0 + new_width), img_h))
 
     # Strategy rules
-    if strategy == "smart":
-        logger.debug("resize_image smart strategy | orientation=%s is_portrait=%s", orientation, is_portrait)
+    elif strategy == "smart":
+        branch = f"smart {orientation} {'portrait' if is_portrait else 'landscape'}"
         if orientation == "horizontal":
             if is_portrait:
-                fitted = ImageOps.contain(image, (desired_width, desired_height), method=Image.LANCZOS)
-                canvas = Image.new("RGB", (desired_width, desired_height), background)
-                x = (desired_width - fitted.width) // 2
-                y = (desired_height - fitted.height) // 2
-                canvas.paste(fitted, (x, y))
-                logger.debug("resize_image smart horizontal portrait result_size=%s", canvas.size)
-                return canvas
+                result = _contain_on_canvas(image, size, background)
             else:
-                result = ImageOps.fit(image, (desired_width, desired_height), method=Image.LANCZOS, centering=(0.5, 0.5))
-                logger.debug("resize_image smart horizontal landscape result_size=%s", result.size)
-                return result
+                result = ImageOps.fit(image, size, method=RESAMPLE, centering=(0.5, 0.5))
         else:  # vertical
             if is_portrait:
-                result = ImageOps.fit(image, (desired_width, desired_height), method=Image.LANCZOS, centering=(0.5, 0.5))
-                logger.debug("resize_image smart vertical portrait result_size=%s", result.size)
-                return result
+                result = ImageOps.fit(image, size, method=RESAMPLE, centering=(0.5, 0.5))
             else:
-                result = image.resize((desired_width, desired_height), Image.LANCZOS)
-                logger.debug("resize_image smart vertical landscape result_size=%s", result.size)
-                return result
-
-    if strategy == "contain":
-        logger.debug("resize_image contain strategy")
-        fitted = ImageOps.contain(image, (desired_width, desired_height), method=Image.LANCZOS)
-        canvas = Image.new("RGB", (desired_width, desired_height), background)
-        x = (desired_width - fitted.width) // 2
-        y = (desired_height - fitted.height) // 2
-        canvas.paste(fitted, (x, y))
-        logger.debug("resize_image contain result_size=%s", canvas.size)
-        return canvas
-
-    if strategy == "stretch":
-        logger.debug("resize_image stretch strategy")
-        result = image.resize((desired_width, desired_height), Image.LANCZOS)
-        logger.debug("resize_image stretch result_size=%s", result.size)
-        return result
-
-    # default == cover
-    logger.debug("resize_image cover/default strategy")
-    result = ImageOps.fit(image, (desired_width, desired_height), method=Image.LANCZOS, centering=(0.5, 0.5))
-    logger.debug("resize_image cover result_size=%s", result.size)
+                result = image.resize(size, RESAMPLE)
+
+    elif strategy == "contain":
+        branch = "contain"
+        result = _contain_on_canvas(image, size, background)
+
+    elif strategy == "stretch":
+        branch = "stretch"
+        result = image.resize(size, RESAMPLE)
+
+    else:  # default == cover
+        branch = "cover"
+        result = ImageOps.fit(image, size, method=RESAMPLE, centering=(0.5, 0.5))
+
+    logger.debug(
+        "resize_image %s | image_size=%s result_size=%s fit=%s background=%s",
+        branch,
+        source_size,
+        result.size,
+        fit,
+        background,
+    )
     return result
 
-def apply_image_enhancement(img, image_settings={}):
+def _apply_brightness_contrast(img, brightness, contrast):
+    """
+    Apply brightness then contrast in a single point() pass. Both are
+    per-channel affine maps, so they compose into one lookup table; the
+    contrast mean is taken from the luminance histogram scaled by brightness.
+    """
+    if img.mode not in ("L", "LA", "RGB", "RGBA"):
+        img = ImageEnhance.Brightness(img).enhance(brightness)
+        return ImageEnhance.Contrast(img).enhance(contrast)
 
-    # Apply Brightness
-    img = ImageEnhance.Brightness(img).enhance(image_settings.get("brightness", 1.0))
+    # ImageEnhance blends with Image.blend(), which truncates rather than rounds
+    brightened = [min(255, int(v * brightness)) for v in range(256)]
 
-    # Apply Contrast
-    img = ImageEnhance.Contrast(img).enhance(image_settings.get("contrast", 1.0))
+    mean = 0
+    if contrast != 1.0:
+        histogram = img.convert("L").histogram()
+        total = max(1, img.width * img.height)
+        mean = int(sum(count * brightened[v] for v, count in enumerate(histogram)) / total + 0.5)
 
-    # Apply Saturation (Color)
-    img = ImageEnhance.Color(img).enhance(image_settings.get("saturation", 1.0))
+    lut = [min(255, max(0, int(mean + contrast * (v - mean)))) for v in brightened]
+    identity = list(range(256))
+    return img.point([value for band in img.getbands() for value in (identity if band == "A" else lut)])
+
+def _enhance_color_matrix(img, brightness, contrast, saturation):
+    """
+    Apply brightness, contrast and saturation to an RGB image in one
+    convert() pass. Brightness scales, contrast blends towards the mean luma
+    and saturation blends each pixel towards its own luma, so the three
+    compose into a single 3x4 color matrix.
+
+    The matrix only clips its final output, so it matches the sequential
+    chain only while no stage can leave 0-255 (every factor <= 1.0), or when
+    just one stage is applied.
+    """
+    mean = 0
+    if contrast != 1.0:
+        # Per-channel means from the RGB histogram, without materializing an L image
+        histogram = img.histogram()
+        total = max(1, img.width * img.height)
+        channel_means = [
+            sum(v * count for v, count in enumerate(histogram[band * 256:(band + 1) * 256])) / total
+            for band in range(3)
+        ]
+        mean = int(sum(w * m for w, m in zip(LUMA_WEIGHTS, channel_means)) * brightness + 0.5)
+
+    scale = contrast * brightness
+    offset = (1 - contrast) * mean
+    matrix = []
+    for row in range(3):
+        for col in range(3):
+            identity = 1.0 if row == col else 0.0
+            matrix.append(scale * (saturation * identity + (1 - saturation) * LUMA_WEIGHTS[col]))
+        matrix.append(offset)
+    return img.convert("RGB", tuple(matrix))
+
+def apply_image_enhancement(img, image_settings=None):
+    if image_settings is None:
+        image_settings = {}
+    brightness = image_settings.get("brightness", 1.0)
+    contrast = image_settings.get("contrast", 1.0)
+    saturation = image_settings.get("saturation", 1.0)
+    sharpness = image_settings.get("sharpness", 1.0)
+
+    # Neutral settings (the default) leave the image untouched
+    if brightness == contrast == saturation == sharpness == 1.0:
+        return img
+
+    use_matrix = not _PILLOW_SIMD and img.mode == "RGB"
+
+    if use_matrix and max(brightness, contrast, saturation) <= 1.0:
+        # No stage can push values out of range, so all three fuse into one pass
+        img = _enhance_color_matrix(img, brightness, contrast, saturation)
+    else:
+        # Apply Brightness and Contrast, clipping like the sequential enhancers
+        if brightness != 1.0 or contrast != 1.0:
+            img = _apply_brightness_contrast(img, brightness, contrast)
+
+        # Apply Saturation (Color)
+        if saturation != 1.0:
+            if use_matrix:
+                img = _enhance_color_matrix(img, 1.0, 1.0, saturation)
+            else:
+                img = ImageEnhance.Color(img).enhance(saturation)
 
     # Apply Sharpness
-    img = ImageEnhance.Sharpness(img).enhance(image_settings.get("sharpness", 1.0))
+    if sharpness != 1.0:
+        img = ImageEnhance.Sharpness(img).enhance(sharpness)
 
     return img
 
 def compute_image_hash(image):
-    """Compute SHA-256 hash of an image."""
-    image = image.convert("RGB")
-    img_bytes = image.tobytes()
-    return hashlib.sha256(img_bytes).hexdigest()
+    """
+    Compute a BLAKE2b (256-bit) fingerprint of an image's RGB pixels.
+
+    The hash only detects whether the frame changed, so it does not need
+    SHA-256; BLAKE2b is built into hashlib and several times faster on the
+    Pi's CPUs, which lack SHA instructions.
+
+    Pixels are streamed from Pillow's raw encoder straight into the hash, the
+    same chunks tobytes() would join, so the full uncompressed frame is never
+    materialized as a single bytes object.
+    """
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    image.load()
+
+    digest = hashlib.blake2b(digest_size=32)
+    # The raw encoder rejects an empty tile; tobytes() returns b"" for these too
+    if image.width == 0 or image.height == 0:
+        return digest.hexdigest()
+
+    # Mirrors the encode loop inside Image.tobytes() (checked against Pillow 11.0.0).
+    # _getencoder() and the (consumed, status, data) tuple from encode() are Pillow
+    # internals, so recheck this loop when upgrading Pillow or Pillow-SIMD.
+    encoder = Image._getencoder(image.mode, "raw", image.mode)
+    encoder.setimage(image.im)
+    bufsize = max(HASH_CHUNK_BYTES, image.width * 4)  # see RawEncode.c
+    while True:
+        _, status, data = encoder.encode(bufsize)
+        digest.update(data)
+        if status:
+            break
+    if status < 0:
+        raise RuntimeError(f"Image encoder failed while hashing (error {status})")
+    return digest.hexdigest()
 
 def take_screenshot_html(html_str, dimensions, timeout_ms=None):
     image = None
     try:
-        # Create a temporary HTML file
-        with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as html_file:
-            html_file.write(html_str.encode("utf-8"))
-            html_file_path = html_file.name
-
-        image = take_screenshot(html_file_path, dimensions, timeout_ms)
+        # Rendered templates link style sheets and fonts by local path, which only
+        # resolve from a file:// document (not a data: URL), so write a temp file
+        with tempfile.TemporaryDirectory(dir=TEMP_DIR) as tmp_dir:
+            html_file_path = os.path.join(tmp_dir, "page.html")
+            with open(html_file_path, "wb") as html_file:
+                html_file.write(html_str.encode("utf-8"))
 
-        # Remove html file
-        os.remove(html_file_path)
+            image = take_screenshot(html_file_path, dimensions, timeout_ms)
 
     except Exception as e:
         logger.error(f"Failed to take screenshot: {str(e)}")
 
     return image
 
+def _screenshot_command(target, dimensions, timeout_ms, output_path):
+    command = [
+        CHROMIUM_BINARY,
+        target,
+        f"--screenshot={output_path}",
+        f"--window-size={dimensions[0]},{dimensions[1]}",
+        *CHROMIUM_FLAGS
+    ]
+    if timeout_ms:
+        command.append(f"--timeout={timeout_ms}")
+    return command
+
+def _extract_png(output):
+    """Slice a PNG out of chromium's stdout, ignoring any log lines around it."""
+    start = output.find(PNG_SIGNATURE)
+    end = output.rfind(PNG_END)
+    if start < 0 or end < start:
+        return None
+    return output[start:end + len(PNG_END)]
+
 def take_screenshot(target, dimensions, timeout_ms=None):
-    image = None
-    try:
-        # Create a temporary output file for the screenshot
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as img_file:
-            img_file_path = img_file.name
-
-        command = [
-            "chromium-headless-shell",
-            target,
-            "--headless",
-            f"--screenshot={img_file_path}",
-            f"--window-size={dimensions[0]},{dimensions[1]}",
-            "--disable-dev-shm-usage",
-            "--disable-gpu",
-            "--use-gl=swiftshader",
-            "--hide-scrollbars",
-            "--in-process-gpu",
-            "--js-flags=--jitless",
-            "--disable-zero-copy",
-            "--disable-gpu-memory-buffer-compositor-resources",
-            "--disable-extensions",
-            "--disable-plugins",
-            "--mute-audio",
-            "--no-sandbox"
-        ]
-        if timeout_ms:
-            command.append(f"--timeout={timeout_ms}")
-        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-        # Check if the process failed or the output file is missing
-        if result.returncode != 0 or not os.path.exists(img_file_path):
-            logger.error("Failed to take screenshot:")
-            logger.error(result.stderr.decode('utf-8'))
-            return None
+    global _SCREENSHOT_TO_STDOUT
 
-        # Load the image using PIL
-        with Image.open(img_file_path) as img:
-            image = img.copy()
+    # Reuse the long-lived browser when possible, cold-starting chromium only as a fallback
+    if HeadlessBrowser.is_supported():
+        image = _BROWSER.screenshot(target, dimensions, timeout_ms)
+        if image is not None:
+            return image
 
-        # Remove image files
-        os.remove(img_file_path)
+    image = None
+    try:
+        # Have chromium write the PNG to its stdout pipe and decode it in memory
+        if _SCREENSHOT_TO_STDOUT:
+            command = _screenshot_command(target, dimensions, timeout_ms, "/dev/stdout")
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+            if result.returncode != 0:
+                logger.error("Failed to take screenshot:")
+                logger.error(result.stderr.decode('utf-8'))
+                return None
+
+            png_bytes = _extract_png(result.stdout)
+            if png_bytes:
+                with Image.open(BytesIO(png_bytes)) as img:
+                    return img.convert("RGB")
+
+            logger.warning("Chromium did not write the screenshot to stdout, falling back to a temporary file")
+            _SCREENSHOT_TO_STDOUT = False
+
+        # Write the screenshot into a temporary directory that is removed on every exit path
+        with tempfile.TemporaryDirectory(dir=TEMP_DIR) as tmp_dir:
+            img_file_path = os.path.join(tmp_dir, "screenshot.png")
+
+            command = _screenshot_command(target, dimensions, timeout_ms, img_file_path)
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+            # Check if the process failed or the output file is missing
+            if result.returncode != 0 or not os.path.exists(img_file_path):
+                logger.error("Failed to take screenshot:")
+                logger.error(result.stderr.decode('utf-8'))
+                return None
+
+            # Load the image using PIL
+            with Image.open(img_file_path) as img:
+                image = img.convert("RGB")
 
     except Exception as e:
         logger.error(f"Failed to take screenshot: {str(e)}")